@@ -8,6 +8,21 @@ libinfo_content = open(libinfo_py, 'r', encoding='utf8').readlines()
 version_line = [l.strip() for l in libinfo_content if l.startswith('__version__')][0]
 exec(version_line)  # gives __version__
 
+# The _geom extension is optional: it accelerates the hot geometry
+# kernels but the library falls back to NumPy/Numba code without it.
+# _geom.pyx uses the `noexcept` qualifier, which needs Cython >= 3.0;
+# with an older Cython (or any compilation problem) the install must
+# still go through without the extension.
+try:
+    import Cython
+    from Cython.Build import cythonize
+    assert int(Cython.__version__.split('.')[0]) >= 3
+    ext_modules = cythonize(
+        [os.path.join('src', pkg_name, '_geom.pyx')],
+        compiler_directives={'language_level': 3})
+except Exception:
+    ext_modules = []
+
 setup(name         = "layoutparser",
       version      = __version__,
       author       = "Zejiang Shen Ruochen Zhang",
@@ -15,6 +30,7 @@ setup(name         = "layoutparser",
       url          = "https://github.com/Layout-Parser/layout-parser",
       package_dir  = {"": "src"},
       packages     = find_packages("src"),
+      ext_modules  = ext_modules,
       long_description=open("README.md", "r", encoding="utf-8").read(),
       long_description_content_type="text/markdown",
       python_requires='>=3.6',
@@ -0,0 +1,205 @@
+"""Optional compiled kernels for the hot geometry helpers used in
+:mod:`layoutparser.elements`.
+
+The helpers in this module are pure-numeric and sit inside the inner loops
+of the geometric relations (e.g., `is_in` and `condition_on` between
+Rectangles and Quadrilaterals over a Layout). When Numba is installed,
+they are compiled to straight-line scalar code that avoids the NumPy
+dispatch and temporary-array overhead. Otherwise, the equivalent NumPy
+implementations are used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _vertice_in_polygon(vertice, polygon_points):
+    # The polygon_points are ordered clockwise
+
+    # The implementation is based on the algorithm from
+    # https://demonstrations.wolfram.com/AnEfficientTestForAPointToBeInAConvexPolygon/
+
+    points = polygon_points - vertice  # shift the coordinates origin to the vertice
+    edges = np.roll(points, -1, axis=0)
+    cross = points[:, 0] * edges[:, 1] - points[:, 1] * edges[:, 0]
+    return bool(np.all(cross >= 0))
+    # If the points are ordered clockwise, the det should <=0
+
+
+def _points_in_polygon(points, polygon_points):
+    # The batched version of _vertice_in_polygon: test all the points
+    # against the polygon in a single vectorized evaluation and return
+    # a boolean array of shape (len(points),).
+
+    diff = polygon_points[None, :, :] - points[:, None, :]  # (V, P, 2)
+    edges = np.roll(diff, -1, axis=1)
+    cross = diff[:, :, 0] * edges[:, :, 1] - diff[:, :, 1] * edges[:, :, 0]
+    return np.all(cross >= 0, axis=1)
+
+
+def _contains_batch(all_points, polygon_points):
+    # Test, for a stack of quadrilaterals of shape (N, 4, 2), whether
+    # each one lies fully inside the polygon. Returns a boolean array
+    # of shape (N,).
+
+    mask = _points_in_polygon(all_points.reshape(-1, 2), polygon_points)
+    return mask.reshape(all_points.shape[0], 4).all(axis=1)
+
+
+def _inv_3x3(M):
+    # The closed-form 3x3 inverse via the adjugate matrix, avoiding
+    # the LAPACK dispatch of np.linalg.inv.
+
+    a, b, c = M[0, 0], M[0, 1], M[0, 2]
+    d, e, f = M[1, 0], M[1, 1], M[1, 2]
+    g, h, i = M[2, 0], M[2, 1], M[2, 2]
+
+    A = e * i - f * h
+    B = f * g - d * i
+    C = d * h - e * g
+
+    det = a * A + b * B + c * C
+    if det == 0:
+        # Preserve the np.linalg.inv error path for the degenerate
+        # quadrilaterals whose perspective matrix is singular.
+        raise np.linalg.LinAlgError("Singular matrix")
+
+    return np.array([
+        [A, c * h - b * i, b * f - c * e],
+        [B, a * i - c * g, c * d - a * f],
+        [C, b * g - a * h, a * e - b * d],
+    ]) / det
+
+
+def _perspective_transformation(M, points):
+
+    # Apply the homogeneous transformation in one fused expression
+    # instead of padding the points with ones, transposing, and slicing
+    # back, which would allocate an intermediate array at each step.
+    x, y = points[:, 0], points[:, 1]
+    w = M[2, 0]*x + M[2, 1]*y + M[2, 2]
+
+    return np.stack([(M[0, 0]*x + M[0, 1]*y + M[0, 2]) / w,
+                     (M[1, 0]*x + M[1, 1]*y + M[1, 2]) / w], axis=1)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def _vertice_in_polygon(vertice, polygon_points):  # noqa: F811
+        # The compiled counterpart of the NumPy version above, with the
+        # cross products unrolled into scalar code and an early exit on
+        # the first edge that fails the test.
+
+        num_points = polygon_points.shape[0]
+        for i in range(num_points):
+            j = (i + 1) % num_points
+            e1_x = polygon_points[i, 0] - vertice[0]
+            e1_y = polygon_points[i, 1] - vertice[1]
+            e2_x = polygon_points[j, 0] - vertice[0]
+            e2_y = polygon_points[j, 1] - vertice[1]
+            if e1_x * e2_y - e1_y * e2_x < 0:
+                return False
+        return True
+
+    @njit(cache=True, fastmath=True)
+    def _points_in_polygon(points, polygon_points):  # noqa: F811
+        # The compiled counterpart of the NumPy version above, with an
+        # early exit per point on the first failing edge.
+
+        num_points = points.shape[0]
+        num_vertices = polygon_points.shape[0]
+        out = np.ones(num_points, dtype=np.bool_)
+        for k in range(num_points):
+            for i in range(num_vertices):
+                j = (i + 1) % num_vertices
+                e1_x = polygon_points[i, 0] - points[k, 0]
+                e1_y = polygon_points[i, 1] - points[k, 1]
+                e2_x = polygon_points[j, 0] - points[k, 0]
+                e2_y = polygon_points[j, 1] - points[k, 1]
+                if e1_x * e2_y - e1_y * e2_x < 0:
+                    out[k] = False
+                    break
+        return out
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _contains_batch(all_points, polygon_points):  # noqa: F811
+        # The compiled counterpart of the NumPy version above: the
+        # quadrilaterals are independent, so the outer loop runs in
+        # parallel, and each one exits on the first vertex that fails
+        # the cross-product test.
+
+        num_quads = all_points.shape[0]
+        num_vertices = polygon_points.shape[0]
+        out = np.ones(num_quads, dtype=np.bool_)
+        for k in prange(num_quads):
+            for p in range(4):
+                for i in range(num_vertices):
+                    j = (i + 1) % num_vertices
+                    e1_x = polygon_points[i, 0] - all_points[k, p, 0]
+                    e1_y = polygon_points[i, 1] - all_points[k, p, 1]
+                    e2_x = polygon_points[j, 0] - all_points[k, p, 0]
+                    e2_y = polygon_points[j, 1] - all_points[k, p, 1]
+                    if e1_x * e2_y - e1_y * e2_x < 0:
+                        out[k] = False
+                        break
+                if not out[k]:
+                    break
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def _inv_3x3(M):  # noqa: F811
+        # The compiled counterpart of the NumPy version above.
+
+        a, b, c = M[0, 0], M[0, 1], M[0, 2]
+        d, e, f = M[1, 0], M[1, 1], M[1, 2]
+        g, h, i = M[2, 0], M[2, 1], M[2, 2]
+
+        A = e * i - f * h
+        B = f * g - d * i
+        C = d * h - e * g
+
+        det = a * A + b * B + c * C
+        if det == 0:
+            raise np.linalg.LinAlgError("Singular matrix")
+
+        M_inv = np.empty((3, 3), dtype=np.float64)
+        M_inv[0, 0] = A / det
+        M_inv[0, 1] = (c * h - b * i) / det
+        M_inv[0, 2] = (b * f - c * e) / det
+        M_inv[1, 0] = B / det
+        M_inv[1, 1] = (a * i - c * g) / det
+        M_inv[1, 2] = (c * d - a * f) / det
+        M_inv[2, 0] = C / det
+        M_inv[2, 1] = (b * g - a * h) / det
+        M_inv[2, 2] = (a * e - b * d) / det
+        return M_inv
+
+    @njit(cache=True, fastmath=True)
+    def _perspective_transformation(M, points):  # noqa: F811
+
+        num_points = points.shape[0]
+        dst = np.empty((num_points, 2), dtype=np.float64)
+        for i in range(num_points):
+            x, y = points[i, 0], points[i, 1]
+            w = M[2, 0] * x + M[2, 1] * y + M[2, 2]
+            dst[i, 0] = (M[0, 0] * x + M[0, 1] * y + M[0, 2]) / w
+            dst[i, 1] = (M[1, 0] * x + M[1, 1] * y + M[1, 2]) / w
+        return dst
+
+
+try:
+    # Prefer the ahead-of-time compiled Cython kernels when the optional
+    # _geom extension has been built: same scalar code as the Numba
+    # versions, without the JIT warmup.
+    from ._geom import (_contains_batch,  # noqa: F401, F811
+                        _perspective_transformation,
+                        _points_in_polygon,
+                        _vertice_in_polygon)
+except ImportError:
+    pass
@@ -0,0 +1,116 @@
+# cython: language_level=3
+"""Ahead-of-time compiled kernels for the hot geometry helpers in
+:mod:`layoutparser.elements`.
+
+Building this extension is optional: when it is present, it replaces
+the kernels in :mod:`layoutparser._fast` with straight C code that has
+no per-call Python overhead and no JIT warmup.
+"""
+
+import numpy as np
+
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef bint _vertice_in_polygon_c(double[::1] vertice,
+                                double[:, ::1] polygon_points) noexcept nogil:
+    cdef Py_ssize_t num_points = polygon_points.shape[0]
+    cdef Py_ssize_t i, j
+    cdef double e1_x, e1_y, e2_x, e2_y
+
+    for i in range(num_points):
+        j = i + 1
+        if j == num_points:
+            j = 0
+        e1_x = polygon_points[i, 0] - vertice[0]
+        e1_y = polygon_points[i, 1] - vertice[1]
+        e2_x = polygon_points[j, 0] - vertice[0]
+        e2_y = polygon_points[j, 1] - vertice[1]
+        if e1_x * e2_y - e1_y * e2_x < 0:
+            return False
+    return True
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef void _perspective_transformation_c(double[:, ::1] M,
+                                        double[:, ::1] points,
+                                        double[:, ::1] out) noexcept nogil:
+    cdef Py_ssize_t num_points = points.shape[0]
+    cdef Py_ssize_t i
+    cdef double x, y, w
+
+    for i in range(num_points):
+        x = points[i, 0]
+        y = points[i, 1]
+        w = M[2, 0] * x + M[2, 1] * y + M[2, 2]
+        out[i, 0] = (M[0, 0] * x + M[0, 1] * y + M[0, 2]) / w
+        out[i, 1] = (M[1, 0] * x + M[1, 1] * y + M[1, 2]) / w
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _points_in_polygon_c(double[:, ::1] points,
+                               double[:, ::1] polygon_points,
+                               unsigned char[::1] out) noexcept nogil:
+    cdef Py_ssize_t num_points = points.shape[0]
+    cdef Py_ssize_t num_vertices = polygon_points.shape[0]
+    cdef Py_ssize_t k, i, j
+    cdef double e1_x, e1_y, e2_x, e2_y
+
+    for k in range(num_points):
+        out[k] = 1
+        for i in range(num_vertices):
+            j = i + 1
+            if j == num_vertices:
+                j = 0
+            e1_x = polygon_points[i, 0] - points[k, 0]
+            e1_y = polygon_points[i, 1] - points[k, 1]
+            e2_x = polygon_points[j, 0] - points[k, 0]
+            e2_y = polygon_points[j, 1] - points[k, 1]
+            if e1_x * e2_y - e1_y * e2_x < 0:
+                out[k] = 0
+                break
+
+
+def _vertice_in_polygon(vertice, polygon_points):
+    # The polygon_points are ordered clockwise; see layoutparser._fast
+    # for the reference implementation.
+    return _vertice_in_polygon_c(
+        np.ascontiguousarray(vertice, dtype=np.float64),
+        np.ascontiguousarray(polygon_points, dtype=np.float64))
+
+
+def _points_in_polygon(points, polygon_points):
+    # The batched version of _vertice_in_polygon; returns a boolean
+    # array of shape (len(points),).
+    out = np.empty(points.shape[0], dtype=np.uint8)
+    _points_in_polygon_c(
+        np.ascontiguousarray(points, dtype=np.float64),
+        np.ascontiguousarray(polygon_points, dtype=np.float64),
+        out)
+    return out.view(np.bool_)
+
+
+def _contains_batch(all_points, polygon_points):
+    # Containment test for a stack of quadrilaterals of shape
+    # (N, 4, 2); returns a boolean array of shape (N,).
+    all_points = np.ascontiguousarray(all_points, dtype=np.float64)
+    out = np.empty(all_points.shape[0] * 4, dtype=np.uint8)
+    _points_in_polygon_c(
+        all_points.reshape(-1, 2),
+        np.ascontiguousarray(polygon_points, dtype=np.float64),
+        out)
+    return out.view(np.bool_).reshape(-1, 4).all(axis=1)
+
+
+def _perspective_transformation(M, points):
+    out = np.empty((points.shape[0], 2))
+    _perspective_transformation_c(
+        np.ascontiguousarray(M, dtype=np.float64),
+        np.ascontiguousarray(points, dtype=np.float64),
+        out)
+    return out
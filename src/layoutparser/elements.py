@@ -1,79 +1,96 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from copy import copy, deepcopy
-from inspect import getmembers, isfunction
+from inspect import isfunction
 import warnings
 import functools
 import numpy as np
-import pandas as pd
-from PIL import Image
-from cv2 import getPerspectiveTransform as _getPerspectiveTransform
-from cv2 import warpPerspective as _warpPerspective
+
+from ._fast import (_contains_batch, _inv_3x3, _perspective_transformation,
+                    _points_in_polygon, _vertice_in_polygon)
 
 __all__ = ['Interval', 'Rectangle', 'Quadrilateral', 'TextBlock', 'Layout']
 
+# pandas, PIL, and cv2 add substantially to the import time of the module
+# yet are only needed by a handful of methods, so they are imported on
+# first use and stashed in these module globals.
+pd = None
+Image = None
+_getPerspectiveTransform = None
+_warpPerspective = None
+_warpAffine = None
 
-def _cvt_coordinates_to_points(coords):
 
-    x_1, y_1, x_2, y_2 = coords
-    return np.array([[x_1, y_1],  # Top Left
-                     [x_2, y_1],  # Top Right
-                     [x_2, y_2],  # Bottom Right
-                     [x_1, y_2],  # Bottom Left
-                     ])
+def _lazy_import_pandas():
+    global pd
+    if pd is None:
+        import pandas
+        pd = pandas
 
 
-def _cvt_points_to_coordinates(points):
-    x_1 = points[:, 0].min()
-    y_1 = points[:, 1].min()
-    x_2 = points[:, 0].max()
-    y_2 = points[:, 1].max()
-    return (x_1, y_1, x_2, y_2)
-
+def _lazy_import_pil():
+    global Image
+    if Image is None:
+        from PIL import Image as _pil_image
+        Image = _pil_image
 
-def _perspective_transformation(M, points, is_inv=False):
 
-    if is_inv:
-        M = np.linalg.inv(M)
+def _lazy_import_cv2():
+    global _getPerspectiveTransform, _warpPerspective, _warpAffine
+    if _getPerspectiveTransform is None:
+        from cv2 import getPerspectiveTransform, warpPerspective, warpAffine
+        _getPerspectiveTransform = getPerspectiveTransform
+        _warpPerspective = warpPerspective
+        _warpAffine = warpAffine
 
-    src_mid = np.hstack([points, np.ones((points.shape[0], 1))]).T  # 3x4
-    dst_mid = np.matmul(M, src_mid)
 
-    dst = (dst_mid/dst_mid[-1]).T[:, :2]  # 4x2
+def _cvt_coordinates_to_points(coords):
 
-    return dst
+    x_1, y_1, x_2, y_2 = coords
+    # Assigning into a pre-allocated buffer is notably faster than
+    # np.array on a list of lists.
+    points = np.empty((4, 2))
+    points[0] = (x_1, y_1)  # Top Left
+    points[1] = (x_2, y_1)  # Top Right
+    points[2] = (x_2, y_2)  # Bottom Right
+    points[3] = (x_1, y_2)  # Bottom Left
+    return points
 
 
-def _vertice_in_polygon(vertice, polygon_points):
-    # The polygon_points are ordered clockwise
+def _cvt_points_to_coordinates(points):
+    # Two axis reductions instead of four column reductions: each column
+    # min/max walks the array separately, while min/max over axis 0
+    # produce both coordinates in one pass each.
+    x_1, y_1 = points.min(axis=0)
+    x_2, y_2 = points.max(axis=0)
+    return (x_1, y_1, x_2, y_2)
 
-    # The implementation is based on the algorithm from
-    # https://demonstrations.wolfram.com/AnEfficientTestForAPointToBeInAConvexPolygon/
 
-    points = polygon_points - vertice  # shift the coordinates origin to the vertice
-    edges = np.append(points, points[0:1, :], axis=0)
-    return all([np.linalg.det([e1, e2]) >= 0 for e1, e2 in zip(edges, edges[1:])])
-    # If the points are ordered clockwise, the det should <=0
+def _cvt_to_xy_vector(value, name):
+    # Normalize a scalar or a 2-element iterable into a (2,) float
+    # array once at the API boundary, so the arithmetic downstream is
+    # a single broadcast instead of a per-call isinstance dispatch.
+    vec = np.asarray(value, dtype=np.float64)
+    if vec.ndim == 0:
+        return np.full(2, vec)
+    assert vec.shape == (
+        2,), f"{name} should have 2 elements, one for x dimension and one for y dimension"
+    return vec
 
 
 def _parse_datatype_from_feature_names(feature_names):
 
-    type_feature_map = {
-        Interval: set(Interval.feature_names),
-        Rectangle: set(Rectangle.feature_names),
-        Quadrilateral: set(Quadrilateral.feature_names)
-    }
-
-    for cls, fnames in type_feature_map.items():
-        if set(feature_names) == fnames:
-            return cls
-
-    raise ValueError(
-        "\n "
-        "\n The input feature is incompatible with the designated format."
-        "\n Please check the tutorials for more details."
-        "\n "
-    )
+    # _FEATURE_SET_TO_CLS is built once at the bottom of the module,
+    # after the element classes are defined.
+    try:
+        return _FEATURE_SET_TO_CLS[frozenset(feature_names)]
+    except KeyError:
+        raise ValueError(
+            "\n "
+            "\n The input feature is incompatible with the designated format."
+            "\n Please check the tutorials for more details."
+            "\n "
+        )
 
 
 def _polygon_area(xs, ys):
@@ -89,15 +106,65 @@ def _polygon_area(xs, ys):
     # The formula is equivalent to the original one indicated in the wikipedia
     # page.
 
-    return 0.5*np.abs(np.dot(xs, np.roll(ys, 1)) - np.dot(ys, np.roll(xs, 1)))
+    return 0.5*np.abs(np.dot(xs, np.concatenate((ys[-1:], ys[:-1])))
+                      - np.dot(ys, np.concatenate((xs[-1:], xs[:-1]))))
+
+
+def _quad_area(points):
+    """Calculate the area of a quadrilateral using the closed-form
+    shoelace identity on its two diagonals, avoiding the array
+    allocations of the generic :func:`_polygon_area`.
+
+    Args:
+        points (`np.ndarray`): The 4x2 array of the corner coordinates
+    """
+
+    # tolist() unboxes the coordinates to Python scalars in one pass, so
+    # the arithmetic below runs without any per-element NumPy dispatch.
+    (x_1, y_1), (x_2, y_2), (x_3, y_3), (x_4, y_4) = points.tolist()
+    return 0.5*abs((x_1 - x_3)*(y_2 - y_4) - (x_2 - x_4)*(y_1 - y_3))
+
+
+class _cached_property:
+    """A minimal ``cached_property`` that keeps the memoized values in the
+    ``_cache`` slot of the instance, so that it can be used on classes
+    declaring ``__slots__`` (``functools.cached_property`` requires a
+    per-instance ``__dict__``).
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.attrname = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.attrname = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        try:
+            cache = instance._cache
+        except AttributeError:
+            cache = instance._cache = {}
+
+        try:
+            return cache[self.attrname]
+        except KeyError:
+            val = self.func(instance)
+            cache[self.attrname] = val
+            return val
 
 
 def mixin_textblock_meta(func):
     @functools.wraps(func)
     def wrap(self, *args, **kwargs):
         out = func(self, *args, **kwargs)
-        if isinstance(out, BaseCoordElement):
-            self = copy(self)
+        # A tuple membership test on the concrete coordinate types is
+        # cheaper than the MRO walk of isinstance on this hot path.
+        if type(out) in _COORD_TYPES:
+            self = self._fast_copy()
             self.block = out
             return self
     return wrap
@@ -109,8 +176,11 @@ def inherit_docstrings(cls=None, *, base_class=None):
     if cls is None:
         return functools.partial(inherit_docstrings, base_class=base_class)
 
-    for name, func in getmembers(cls, isfunction):
-        if func.__doc__:
+    # Only the functions defined on the class itself can be missing an
+    # inherited docstring, so scan vars(cls) directly rather than paying
+    # for the sorted MRO-wide traversal of inspect.getmembers.
+    for name, func in vars(cls).items():
+        if not isfunction(func) or func.__doc__:
             continue
         if base_class == None:
             for parent in cls.__mro__[1:]:
@@ -127,7 +197,9 @@ def inherit_docstrings(cls=None, *, base_class=None):
 def support_textblock(func):
     @functools.wraps(func)
     def wrap(self, other, *args, **kwargs):
-        if isinstance(other, TextBlock):
+        # TextBlock is never subclassed, so the exact type check is safe
+        # and avoids the isinstance dispatch on every geometric op.
+        if other.__class__ is TextBlock:
             other = other.block
         out = func(self, other, *args, **kwargs)
         return out
@@ -136,24 +208,67 @@ def support_textblock(func):
 
 class BaseLayoutElement():
 
+    # The _cache slot backs the _cached_property descriptors of the
+    # subclasses. Subclasses declare their data attributes in their own
+    # __slots__ (TextBlock intentionally keeps a __dict__ for flexibility).
+    __slots__ = ('_cache',)
+
+    def _fast_copy(self):
+        # Duplicate the element by calling its constructor directly,
+        # which is notably faster than going through the copy protocol.
+        # Subclasses with fixed fields override this with an explicit
+        # constructor call.
+        return copy(self)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # The memoized geometry may depend on any data attribute, so a
+        # direct assignment (e.g. `rect.x_2 = 20`) must drop it rather
+        # than leave stale values behind.
+        if name != '_cache':
+            try:
+                self._cache.clear()
+            except AttributeError:
+                pass
+
     def set(self, inplace=False, **kwargs):
 
-        obj = self if inplace else copy(self)
-        var_dict = vars(obj)
+        obj = self if inplace else self._fast_copy()
+        # Drop the values memoized by cached properties: they may depend
+        # on the attributes being updated below.
+        obj._cache = {}
+
+        field_names = obj._field_names()
         for key, val in kwargs.items():
-            if key in var_dict:
-                var_dict[key] = val
-            elif f"_{key}" in var_dict:
-                var_dict[f"_{key}"] = val
+            if key in field_names:
+                setattr(obj, key, val)
+            elif f"_{key}" in field_names:
+                setattr(obj, f"_{key}", val)
             else:
                 raise ValueError(f"Unknown attribute name: {key}")
 
         return obj
 
+    def _field_names(self):
+        # The names of the data attributes of the element, whether they
+        # are stored in __slots__ or in a per-instance __dict__.
+        names = []
+        for klass in reversed(type(self).__mro__):
+            for name in getattr(klass, '__slots__', ()):
+                if name != '_cache' and name not in names:
+                    names.append(name)
+        for name in getattr(self, '__dict__', ()):
+            if name not in names:
+                names.append(name)
+        return names
+
+    def _features(self):
+        return {name: getattr(self, name) for name in self._field_names()}
+
     def __repr__(self):
 
         info_str = ', '.join(
-            [f'{key}={val}' for key, val in vars(self).items()])
+            [f'{key}={val}' for key, val in self._features().items()])
         return f"{self.__class__.__name__}({info_str})"
 
     def __eq__(self, other):
@@ -161,11 +276,13 @@ class BaseLayoutElement():
         if other.__class__ is not self.__class__:
             return False
 
-        return vars(self) == vars(other)
+        return self._features() == other._features()
 
 
 class BaseCoordElement(ABC, BaseLayoutElement):
 
+    __slots__ = ()
+
     #######################################################################
     #########################  Layout Properties  #########################
     #######################################################################
@@ -348,6 +465,8 @@ class Interval(BaseCoordElement):
     name = "_interval"
     feature_names = ["x_1", "y_1", "x_2", "y_2", "height", "width"]
 
+    __slots__ = ('start', 'end', 'axis', 'canvas_height', 'canvas_width')
+
     def __init__(self, start, end, axis='x',
                  canvas_height=0, canvas_width=0):
 
@@ -362,6 +481,10 @@ class Interval(BaseCoordElement):
         self.canvas_height = canvas_height
         self.canvas_width = canvas_width
 
+    def _fast_copy(self):
+        return self.__class__(self.start, self.end, self.axis,
+                              self.canvas_height, self.canvas_width)
+
     @property
     def height(self):
         """
@@ -458,6 +581,8 @@ class Interval(BaseCoordElement):
                 those of the input canvas.
         """
 
+        _lazy_import_pil()
+
         if isinstance(canvas, np.ndarray):
             h, w = canvas.shape[:2]
         elif isinstance(canvas, BaseCoordElement):
@@ -684,6 +809,8 @@ class Rectangle(BaseCoordElement):
     name = "_rectangle"
     feature_names = ["x_1", "y_1", "x_2", "y_2"]
 
+    __slots__ = ('x_1', 'y_1', 'x_2', 'y_2')
+
     def __init__(self, x_1, y_1, x_2, y_2):
 
         self.x_1 = x_1
@@ -691,7 +818,10 @@ class Rectangle(BaseCoordElement):
         self.x_2 = x_2
         self.y_2 = y_2
 
-    @property
+    def _fast_copy(self):
+        return self.__class__(self.x_1, self.y_1, self.x_2, self.y_2)
+
+    @_cached_property
     def height(self):
         """
         Calculate the height of the rectangle.
@@ -702,7 +832,7 @@ class Rectangle(BaseCoordElement):
 
         return self.y_2 - self.y_1
 
-    @property
+    @_cached_property
     def width(self):
         """
         Calculate the width of the rectangle.
@@ -713,7 +843,7 @@ class Rectangle(BaseCoordElement):
 
         return self.x_2 - self.x_1
 
-    @property
+    @_cached_property
     def coordinates(self):
         """
         Return the coordinates of the two points that define the rectangle.
@@ -724,11 +854,11 @@ class Rectangle(BaseCoordElement):
 
         return (self.x_1, self.y_1, self.x_2, self.y_2)
 
-    @property
+    @_cached_property
     def points(self):
         """
-        Return the coordinates of all four corners of the rectangle in a clockwise fashion 
-        starting from the upper left. 
+        Return the coordinates of all four corners of the rectangle in a clockwise fashion
+        starting from the upper left.
 
         Returns:
             :obj:`Numpy array`: A Numpy array of shape 4x2 containing the coordinates.
@@ -736,7 +866,7 @@ class Rectangle(BaseCoordElement):
 
         return _cvt_coordinates_to_points(self.coordinates)
 
-    @property
+    @_cached_property
     def center(self):
         """
         Calculate the center of the rectangle.
@@ -747,7 +877,7 @@ class Rectangle(BaseCoordElement):
 
         return (self.x_1 + self.x_2)/2., (self.y_1 + self.y_2)/2.
 
-    @property
+    @_cached_property
     def area(self):
         """
         Return the area of the rectangle.
@@ -773,8 +903,8 @@ class Rectangle(BaseCoordElement):
                                   self.x_2 + dx, self.y_2 + dy)
 
         elif isinstance(other, Quadrilateral):
-            transformed_points = _perspective_transformation(other.perspective_matrix,
-                                                             self.points, is_inv=True)
+            transformed_points = _perspective_transformation(other.perspective_matrix_inv,
+                                                             self.points)
 
             return other.__class__(transformed_points, self.height, self.width)
 
@@ -800,7 +930,7 @@ class Rectangle(BaseCoordElement):
 
         elif isinstance(other, Quadrilateral):
             transformed_points = _perspective_transformation(other.perspective_matrix,
-                                                             self.points, is_inv=False)
+                                                             self.points)
 
             return other.__class__(transformed_points, self.height, self.width)
 
@@ -824,19 +954,21 @@ class Rectangle(BaseCoordElement):
                 return other.start <= c <= other.end
 
         elif isinstance(other, Rectangle):
-            x_interval = other.to_interval(axis='x')
-            y_interval = other.to_interval(axis='y')
-            return self.is_in(x_interval, center=center) and \
-                self.is_in(y_interval, center=center)
+            # Inlined version of the interval-based check on both axes,
+            # without constructing the two throwaway Interval objects.
+            if center:
+                c_x, c_y = self.center
+                return other.x_1 <= c_x <= other.x_2 and \
+                    other.y_1 <= c_y <= other.y_2
+            return other.x_1 <= self.x_1 <= self.x_2 <= other.x_2 and \
+                other.y_1 <= self.y_1 <= self.y_2 <= other.y_2
 
         elif isinstance(other, Quadrilateral):
 
             if not center:
                 # This is equivalent to determine all the points of the
                 # rectangle is in the quadrilateral.
-                is_vertice_in = [_vertice_in_polygon(
-                    vertice, other.points) for vertice in self.points]
-                return all(is_vertice_in)
+                return bool(_points_in_polygon(self.points, other.points).all())
             else:
                 center = np.array(self.center)
                 return _vertice_in_polygon(center, other.points)
@@ -910,6 +1042,28 @@ class Rectangle(BaseCoordElement):
         series = series.dropna()
         return cls(*[series[fname] for fname in cls.feature_names])
 
+    @classmethod
+    def from_arrays(cls, x_1, y_1, x_2, y_2):
+        """
+        Bulk-construct rectangles from arrays of the four coordinates,
+        avoiding the per-element pandas indexing of :meth:`from_series`.
+
+        Args:
+            x_1 (:obj:`Numpy array`): The x coordinates of the upper left corners.
+            y_1 (:obj:`Numpy array`): The y coordinates of the upper left corners.
+            x_2 (:obj:`Numpy array`): The x coordinates of the lower right corners.
+            y_2 (:obj:`Numpy array`): The y coordinates of the lower right corners.
+
+        Returns:
+            :obj:`List[Rectangle]`: The list of the constructed Rectangle objects.
+        """
+
+        # tolist() unboxes the whole array to Python scalars in one pass
+        return [cls(*coords) for coords in zip(np.asarray(x_1).tolist(),
+                                               np.asarray(y_1).tolist(),
+                                               np.asarray(x_2).tolist(),
+                                               np.asarray(y_2).tolist())]
+
 
 @inherit_docstrings
 class Quadrilateral(BaseCoordElement):
@@ -925,6 +1079,12 @@ class Quadrilateral(BaseCoordElement):
         |                      |
         points[3] -...- points[2]
 
+    Note:
+        The points array is treated as immutable: all the mutating
+        methods return new instances, which lets the derived values
+        (e.g., the perspective matrix and the float32 point buffer)
+        be computed once and memoized.
+
     Args:
         points (:obj:`Numpy array`):
             The array of 4 corner coordinates of size 4x2.
@@ -941,6 +1101,8 @@ class Quadrilateral(BaseCoordElement):
                      "p31", "p32", "p41", "p42",
                      "height", "width"]
 
+    __slots__ = ('_points', '_width', '_height')
+
     def __init__(self, points, height=None, width=None):
 
         assert isinstance(
@@ -950,7 +1112,22 @@ class Quadrilateral(BaseCoordElement):
         self._width = width
         self._height = height
 
-    @property
+    def __setattr__(self, name, value):
+        # Store the points as a C-contiguous float32 array: this is the
+        # native layout of the OpenCV perspective functions, so the cv2
+        # interop never has to re-cast or copy. Normalizing here (rather
+        # than in __init__) keeps the invariant through set()/shift()/
+        # scale(), which assign _points on the derived copies directly.
+        if name == '_points':
+            value = np.ascontiguousarray(value, dtype=np.float32)
+        super().__setattr__(name, value)
+
+    def _fast_copy(self):
+        # The points array is shared by reference as it is assumed to be
+        # immutable; set() replaces it wholesale rather than mutating it.
+        return self.__class__(self._points, self._height, self._width)
+
+    @_cached_property
     def height(self):
         """
         Return the user defined height, otherwise the height of its circumscribed rectangle.
@@ -961,9 +1138,9 @@ class Quadrilateral(BaseCoordElement):
 
         if self._height is not None:
             return self._height
-        return self.points[:, 1].max() - self.points[:, 1].min()
+        return np.ptp(self.points[:, 1])
 
-    @property
+    @_cached_property
     def width(self):
         """
         Return the user defined width, otherwise the width of its circumscribed rectangle.
@@ -974,12 +1151,12 @@ class Quadrilateral(BaseCoordElement):
 
         if self._width is not None:
             return self._width
-        return self.points[:, 0].max() - self.points[:, 0].min()
+        return np.ptp(self.points[:, 0])
 
-    @property
+    @_cached_property
     def coordinates(self):
         """
-        Return the coordinates of the upper left and lower right corners points that 
+        Return the coordinates of the upper left and lower right corners points that
         define the circumscribed rectangle.
 
         Returns
@@ -1000,7 +1177,7 @@ class Quadrilateral(BaseCoordElement):
 
         return self._points
 
-    @property
+    @_cached_property
     def center(self):
         """
         Calculate the center of the quadrilateral.
@@ -1009,14 +1186,16 @@ class Quadrilateral(BaseCoordElement):
             :obj:`Tuple(numeric)`: Returns of coordinate of the center.
         """
 
-        return tuple(self.points.mean(axis=0).tolist())
+        (x_1, y_1), (x_2, y_2), (x_3, y_3), (x_4, y_4) = self._points.tolist()
+        return ((x_1 + x_2 + x_3 + x_4) * 0.25,
+                (y_1 + y_2 + y_3 + y_4) * 0.25)
 
-    @property
+    @_cached_property
     def area(self):
         """
         Return the area of the quadrilateral.
         """
-        return _polygon_area(self.points[:, 0], self.points[:, 1])
+        return _quad_area(self.points)
 
     @property
     def mapped_rectangle_points(self):
@@ -1026,20 +1205,74 @@ class Quadrilateral(BaseCoordElement):
 
         return self.map_to_points_ordering(x_map, y_map)
 
-    @property
+    @_cached_property
+    def points_f32(self):
+        """
+        Return the points as a C-contiguous float32 array, the layout
+        required by the OpenCV perspective-transform functions. Cached so
+        that repeated cv2 calls do not pay the conversion copy each time.
+        """
+
+        return np.ascontiguousarray(self._points, dtype='float32')
+
+    @_cached_property
+    def is_axis_aligned(self):
+        """
+        Whether the quadrilateral is an axis-aligned rectangle in the
+        canonical clockwise point ordering (e.g., built via
+        :meth:`Rectangle.to_quadrilateral`).
+        """
+
+        (x_1, y_1), (x_2, y_2), (x_3, y_3), (x_4, y_4) = self._points.tolist()
+        return x_1 == x_4 and x_2 == x_3 and y_1 == y_2 and y_3 == y_4
+
+    @_cached_property
     def perspective_matrix(self):
-        return _getPerspectiveTransform(self.points.astype('float32'),
+        # An axis-aligned quadrilateral only needs an affine
+        # scale+translate, which can be written down directly without
+        # OpenCV's 8x8 perspective solve.
+        if self.is_axis_aligned:
+            (x_1, y_1), (x_2, _), (_, y_3), _ = self._points.tolist()
+            if x_2 > x_1 and y_3 > y_1:
+                scale_x = self.width / (x_2 - x_1)
+                scale_y = self.height / (y_3 - y_1)
+                return np.array([[scale_x, 0., -x_1 * scale_x],
+                                 [0., scale_y, -y_1 * scale_y],
+                                 [0., 0., 1.]])
+
+        _lazy_import_cv2()
+        return _getPerspectiveTransform(self.points_f32,
                                         self.mapped_rectangle_points.astype('float32'))
 
-    def map_to_points_ordering(self, x_map, y_map):
+    @_cached_property
+    def perspective_matrix_inv(self):
+        return _inv_3x3(self.perspective_matrix)
 
-        points_ordering = self.points.argsort(axis=0).argsort(axis=0)
+    @_cached_property
+    def _points_ordering(self):
+        # The rank of each coordinate within its column; this only
+        # depends on the (immutable) points, so it is computed once and
+        # reused across pad/mapping calls on the same quadrilateral.
         # Ref: https://github.com/numpy/numpy/issues/8757#issuecomment-355126992
+        return self._points.argsort(axis=0).argsort(axis=0)
+
+    def map_to_points_ordering(self, x_map, y_map):
+
+        points_ordering = self._points_ordering
 
-        return np.vstack([
-            np.vectorize(x_map.get)(points_ordering[:, 0]),
-            np.vectorize(y_map.get)(points_ordering[:, 1])
-        ]).T
+        # The maps are always keyed by the ranks {0, 1, 2, 3}, so a
+        # length-4 lookup array with fancy indexing replaces the Python
+        # per-element dispatch of np.vectorize(dict.get).
+        x_vals = np.array([x_map[rank] for rank in range(4)])
+        y_vals = np.array([y_map[rank] for rank in range(4)])
+
+        # Gather the two columns straight into one preallocated
+        # contiguous buffer, so the arithmetic consuming the result
+        # (e.g. the fused add in pad) runs over contiguous memory.
+        out = np.empty((4, 2), dtype=np.float64)
+        out[:, 0] = x_vals[points_ordering[:, 0]]
+        out[:, 1] = y_vals[points_ordering[:, 1]]
+        return out
 
     @support_textblock
     def condition_on(self, other):
@@ -1057,8 +1290,8 @@ class Quadrilateral(BaseCoordElement):
 
         elif isinstance(other, Quadrilateral):
 
-            transformed_points = _perspective_transformation(other.perspective_matrix,
-                                                             self.points, is_inv=True)
+            transformed_points = _perspective_transformation(other.perspective_matrix_inv,
+                                                             self.points)
             return self.__class__(transformed_points, self.height, self.width)
 
         else:
@@ -1081,7 +1314,7 @@ class Quadrilateral(BaseCoordElement):
         elif isinstance(other, Quadrilateral):
 
             transformed_points = _perspective_transformation(other.perspective_matrix,
-                                                             self.points, is_inv=False)
+                                                             self.points)
             return self.__class__(transformed_points, self.height, self.width)
 
         else:
@@ -1111,15 +1344,27 @@ class Quadrilateral(BaseCoordElement):
 
         elif isinstance(other, Quadrilateral):
 
+            o_x1, o_y1, o_x2, o_y2 = other.coordinates
+
             if not center:
+                # The bounding box of other contains its polygon, so a
+                # quadrilateral spilling out of the box cannot be inside
+                # and is rejected without the polygon test.
+                s_x1, s_y1, s_x2, s_y2 = self.coordinates
+                if s_x1 < o_x1 or s_y1 < o_y1 or s_x2 > o_x2 or s_y2 > o_y2:
+                    return False
+                if other.is_axis_aligned:
+                    return True
                 # This is equivalent to determine all the points of the
-                # rectangle is in the quadrilateral.
-                is_vertice_in = [_vertice_in_polygon(
-                    vertice, other.points) for vertice in self.points]
-                return all(is_vertice_in)
+                # quadrilateral is in the other quadrilateral.
+                return bool(_points_in_polygon(self.points, other.points).all())
             else:
-                center = np.array(self.center)
-                return _vertice_in_polygon(center, other.points)
+                c_x, c_y = self.center
+                if c_x < o_x1 or c_x > o_x2 or c_y < o_y1 or c_y > o_y2:
+                    return False
+                if other.is_axis_aligned:
+                    return True
+                return _vertice_in_polygon(np.array([c_x, c_y]), other.points)
 
         else:
             raise Exception(f"Invalid input type {other.__class__} for other")
@@ -1132,35 +1377,26 @@ class Quadrilateral(BaseCoordElement):
 
         padding_mat = self.map_to_points_ordering(x_map, y_map)
 
-        points = self.points + padding_mat
+        # Write the padded points and the safe-mode clamp into the same
+        # buffer, so the operation makes a single output allocation.
+        points = np.empty_like(self.points)
+        np.add(self.points, padding_mat, out=points, casting='unsafe')
         if safe_mode:
-            points = np.maximum(points, 0)
+            np.maximum(points, 0, out=points)
 
         return self.set(points=points)
 
     def shift(self, shift_distance=0):
 
-        if not isinstance(shift_distance, Iterable):
-            shift_mat = [shift_distance, shift_distance]
-        else:
-            assert len(
-                shift_distance) == 2, "shift_distance should have 2 elements, one for x dimension and one for y dimension"
-            shift_mat = shift_distance
-
-        points = self.points + np.array(shift_mat)
+        points = self.points + _cvt_to_xy_vector(
+            shift_distance, "shift_distance")
 
         return self.set(points=points)
 
     def scale(self, scale_factor=1):
 
-        if not isinstance(scale_factor, Iterable):
-            scale_mat = [scale_factor, scale_factor]
-        else:
-            assert len(
-                scale_factor) == 2, "scale_factor should have 2 elements, one for x dimension and one for y dimension"
-            scale_mat = scale_factor
-
-        points = self.points * np.array(scale_mat)
+        points = self.points * _cvt_to_xy_vector(
+            scale_factor, "scale_factor")
 
         return self.set(points=points)
 
@@ -1175,7 +1411,13 @@ class Quadrilateral(BaseCoordElement):
             :obj:`Numpy array`: The array of the cropped image.
         """
 
-        return _warpPerspective(image, self.perspective_matrix, (int(self.width), int(self.height)))
+        _lazy_import_cv2()
+        M = self.perspective_matrix
+        dsize = (int(self.width), int(self.height))
+        if M[2, 0] == 0 and M[2, 1] == 0 and M[2, 2] == 1:
+            # The transformation is affine, so the cheaper warp applies.
+            return _warpAffine(image, M[:2], dsize)
+        return _warpPerspective(image, M, dsize)
 
     def to_interval(self, axis='x', **kwargs):
 
@@ -1192,6 +1434,7 @@ class Quadrilateral(BaseCoordElement):
 
     @classmethod
     def from_series(cls, series):
+        _lazy_import_pandas()
         series = series.dropna()
 
         points = pd.to_numeric(
@@ -1204,7 +1447,11 @@ class Quadrilateral(BaseCoordElement):
     def __eq__(self, other):
         if other.__class__ is not self.__class__:
             return False
-        return np.isclose(self.points, other.points).all()
+        # Equivalent to np.isclose(...).all() with the default tolerances
+        # (an elementwise atol + rtol*|other| bound), without the
+        # boolean-array machinery of np.isclose.
+        return bool(np.all(np.abs(self._points - other._points)
+                           <= 1e-8 + 1e-5 * np.abs(other._points)))
 
     def __repr__(self):
         keys = ['points', 'width', 'height']
@@ -1252,6 +1499,14 @@ class TextBlock(BaseLayoutElement):
         self.next = next
         self.score = score
 
+    def _fast_copy(self):
+        # TextBlock intentionally keeps a __dict__ and users may attach
+        # extra attributes beyond the constructor fields, so carry the
+        # whole instance dict over as copy(self) would.
+        out = self.__class__.__new__(self.__class__)
+        out.__dict__.update(self.__dict__)
+        return out
+
     @property
     def height(self):
         """
@@ -1360,41 +1615,215 @@ class Layout(list):
         Quadrilateral.name: Quadrilateral,
         TextBlock.name:     TextBlock}
 
+    def _points_soa(self):
+        # Stack the points of all the elements into one (N, 4, 2) buffer
+        # so the geometric methods can run as single NumPy operations
+        # instead of per-element Python dispatch.
+        return np.array([ele.points for ele in self])
+
+    def _is_all(self, target_type):
+        return bool(self) and \
+            all(ele.__class__ is target_type for ele in self)
+
+    @property
+    def area(self):
+        """
+        Calculate the area of all the elements in one vectorized shoelace
+        evaluation over the stacked point buffer.
+
+        Returns:
+            :obj:`Numpy array`: The areas of the elements in the list.
+        """
+
+        if not len(self):
+            return np.zeros(0)
+
+        points = self._points_soa()
+        x, y = points[..., 0], points[..., 1]
+        return 0.5*np.abs((x*np.roll(y, -1, axis=1)
+                           - y*np.roll(x, -1, axis=1)).sum(axis=1))
+
+    def _transform_quads(self, M):
+        # Apply one homogeneous transformation to every element through
+        # a single kernel call over the stacked point buffer, instead of
+        # one _perspective_transformation dispatch per element.
+        points = _perspective_transformation(
+            M, self._points_soa().reshape(-1, 2).astype(np.float64))
+        points = points.reshape(len(self), 4, 2)
+        return self.__class__(
+            [Quadrilateral(pts, ele.height, ele.width)
+             for ele, pts in zip(self, points)])
+
     def relative_to(self, other):
+        block = other.block if other.__class__ is TextBlock else other
+        if block.__class__ is Quadrilateral and self._is_all(Quadrilateral):
+            return self._transform_quads(block.perspective_matrix)
         return self.__class__([ele.relative_to(other) for ele in self])
 
     def condition_on(self, other):
+        block = other.block if other.__class__ is TextBlock else other
+        if block.__class__ is Quadrilateral and self._is_all(Quadrilateral):
+            return self._transform_quads(block.perspective_matrix_inv)
         return self.__class__([ele.condition_on(other) for ele in self])
 
     def is_in(self, other, **kwargs):
         return self.__class__([ele.is_in(other, **kwargs) for ele in self])
 
-    def filter_by(self, other, **kwargs):
+    def contains_matrix(self, others):
+        """
+        Batched containment test between the elements in the current layout
+        and a collection of container elements. The coordinates of both sides
+        are stacked once and compared with a vectorized bounding-box test;
+        only the pairs that survive the pre-filter are rechecked with the
+        exact polygon test when the container is a Quadrilateral. Intervals
+        have a degenerate bounding box on their off axis, so any pair
+        involving an Interval falls back to the scalar `is_in`.
+
+        Args:
+            others (:obj:`Layout` or :obj:`List[BaseCoordElement]`):
+                The container elements to test against.
+
+        Returns:
+            :obj:`Numpy array`:
+                A bool array of shape `(len(self), len(others))` where entry
+                `(i, j)` indicates whether element `i` is in container `j`.
+        """
+
+        if not len(self) or not len(others):
+            return np.zeros((len(self), len(others)), dtype=bool)
+
+        blocks = [ele.block if ele.__class__ is TextBlock else ele
+                  for ele in self]
+        other_blocks = [other.block if other.__class__ is TextBlock else other
+                        for other in others]
+
+        R = np.array([block.coordinates for block in blocks], dtype=float)
+        C = np.array([block.coordinates for block in other_blocks],
+                     dtype=float)
+
+        mask = (R[:, None, 0] >= C[None, :, 0]) & \
+               (R[:, None, 1] >= C[None, :, 1]) & \
+               (R[:, None, 2] <= C[None, :, 2]) & \
+               (R[:, None, 3] <= C[None, :, 3])
+
+        for j, block in enumerate(other_blocks):
+            if isinstance(block, Quadrilateral):
+                for i in np.flatnonzero(mask[:, j]):
+                    mask[i, j] = _points_in_polygon(
+                        self[i].points, block.points).all()
+            elif isinstance(block, Interval):
+                for i in range(len(self)):
+                    mask[i, j] = self[i].is_in(others[j])
+
+        for i, block in enumerate(blocks):
+            if isinstance(block, Interval):
+                for j in range(len(others)):
+                    mask[i, j] = self[i].is_in(others[j])
+
+        return mask
+
+    def filter_by(self, other, soft_margin={}, center=False):
         """
         Return a `Layout` object containing the elements that are in the `other` object.
 
+        The `other` element is padded once outside the loop, and when all the
+        elements are rectangles or quadrilaterals the containment runs as a
+        single batched test over the stacked point buffer.
+
         Args:
             other (:obj:`BaseCoordElement`)
 
         Returns:
             :obj:`Layout`
         """
-        return self.__class__([ele for ele in self if ele.is_in(other, **kwargs)])
+
+        if other.__class__ is TextBlock:
+            other = other.block
+        other = other.pad(**soft_margin)
+
+        blocks = [ele.block if ele.__class__ is TextBlock else ele
+                  for ele in self]
+        if not center and len(self) and \
+                all(block.__class__ in (Rectangle, Quadrilateral)
+                    for block in blocks):
+
+            if other.__class__ is Quadrilateral:
+                mask = _contains_batch(self._points_soa(), other.points)
+                return self.__class__(
+                    [ele for ele, ok in zip(self, mask) if ok])
+
+            elif other.__class__ is Rectangle:
+                coords = np.array([block.coordinates for block in blocks])
+                mask = (coords[:, 0] >= other.x_1) & \
+                       (coords[:, 1] >= other.y_1) & \
+                       (coords[:, 2] <= other.x_2) & \
+                       (coords[:, 3] <= other.y_2)
+                return self.__class__(
+                    [ele for ele, ok in zip(self, mask) if ok])
+
+        return self.__class__(
+            [ele for ele in self if ele.is_in(other, center=center)])
 
     @functools.wraps(BaseCoordElement.shift)
     def shift(self, shift_distance):
+        if self._is_all(Rectangle):
+            vec = _cvt_to_xy_vector(shift_distance, "shift_distance")
+            coords = np.array([ele.coordinates for ele in self])
+            return self.from_arrays(*(coords + np.tile(vec, 2)).T)
+
         return self.__class__([ele.shift(shift_distance) for ele in self])
 
     @functools.wraps(BaseCoordElement.pad)
-    def pad(self, **kwargs):
-        return self.__class__([ele.pad(**kwargs) for ele in self])
+    def pad(self, left=0, right=0, top=0, bottom=0, safe_mode=True):
+        if self._is_all(Rectangle):
+            coords = np.array([ele.coordinates for ele in self]) \
+                + np.array([-left, -top, right, bottom])
+            if safe_mode:
+                coords[:, :2] = np.maximum(coords[:, :2], 0)
+            return self.from_arrays(*coords.T)
+
+        return self.__class__([ele.pad(left=left, right=right, top=top,
+                                       bottom=bottom, safe_mode=safe_mode)
+                               for ele in self])
 
     @functools.wraps(BaseCoordElement.scale)
     def scale(self, scale_factor):
+        if self._is_all(Rectangle):
+            vec = _cvt_to_xy_vector(scale_factor, "scale_factor")
+            coords = np.array([ele.coordinates for ele in self])
+            return self.from_arrays(*(coords * np.tile(vec, 2)).T)
+
         return self.__class__([ele.scale(scale_factor) for ele in self])
 
     def crop_image(self, image):
-        return [ele.crop_image(image) for ele in self]
+        """
+        Crop the input image for all the elements in the list. The
+        quadrilateral crops pre-allocate their output buffers and hand
+        them to cv2.warpPerspective via `dst=`, skipping the per-call
+        output allocation inside OpenCV.
+
+        Args:
+            image (:obj:`Numpy array`): The array of the input image.
+
+        Returns:
+            :obj:`List[Numpy array]`: The arrays of the cropped images.
+        """
+
+        crops = []
+        for ele in self:
+            block = ele.block if ele.__class__ is TextBlock else ele
+            if block.__class__ is Quadrilateral:
+                _lazy_import_cv2()
+                w, h = int(block.width), int(block.height)
+                out = np.empty((h, w) + image.shape[2:], dtype=image.dtype)
+                M = block.perspective_matrix
+                if M[2, 0] == 0 and M[2, 1] == 0 and M[2, 2] == 1:
+                    crops.append(_warpAffine(image, M[:2], (w, h), dst=out))
+                else:
+                    crops.append(_warpPerspective(image, M, (w, h), dst=out))
+            else:
+                crops.append(ele.crop_image(image))
+        return crops
 
     def get_texts(self):
         """
@@ -1419,6 +1848,18 @@ class Layout(list):
         """
         return [getattr(ele, attr_name) for ele in self if hasattr(ele, attr_name)]
 
+    @classmethod
+    def from_arrays(cls, x_1, y_1, x_2, y_2):
+        """
+        Bulk-construct a rectangle-based layout from arrays of the four
+        coordinates. See :meth:`Rectangle.from_arrays`.
+
+        Returns:
+            :obj:`Layout`: The layout of the constructed Rectangle objects.
+        """
+
+        return cls(Rectangle.from_arrays(x_1, y_1, x_2, y_2))
+
     @classmethod
     def from_dataframe(cls, df):
 
@@ -1438,7 +1879,35 @@ class Layout(list):
         else:
             target_type = _parse_datatype_from_feature_names(df.columns)
 
+            if target_type is Rectangle:
+                return cls.from_arrays(
+                    *df[Rectangle.feature_names].to_numpy().T)
+
+            elif target_type is Quadrilateral:
+                # Extract the whole coordinate block once instead of
+                # paying the per-cell boxing of iterrows + from_series.
+                _lazy_import_pandas()
+                points = df[Quadrilateral.feature_names[:8]] \
+                    .to_numpy(dtype=float).reshape(-1, 4, 2)
+                heights = df['height'].tolist()
+                widths = df['width'].tolist()
+                return cls(
+                    [Quadrilateral(points[idx],
+                                   None if pd.isna(heights[idx]) else heights[idx],
+                                   None if pd.isna(widths[idx]) else widths[idx])
+                        for idx in range(len(points))]
+                )
+
             return cls(
                 [target_type.from_series(series)
                     for (_, series) in df.iterrows()]
             )
+
+
+_COORD_TYPES = (Interval, Rectangle, Quadrilateral)
+
+_FEATURE_SET_TO_CLS = {
+    frozenset(Interval.feature_names):      Interval,
+    frozenset(Rectangle.feature_names):     Rectangle,
+    frozenset(Quadrilateral.feature_names): Quadrilateral,
+}
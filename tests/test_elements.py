@@ -59,6 +59,16 @@ def test_quadrilateral():
     q = Quadrilateral(np.array([[-2, 0], [0, 2], [2, 0], [0, -2]]))
     assert q.area == 8.
     
+def test_quadrilateral_mapped_points_keep_floats():
+
+    # The ordering maps used to go through np.vectorize(dict.get), which
+    # inferred an int dtype from the first value and truncated a float
+    # width/height; the mapped points must keep the exact float values.
+    points = np.array([[2.0, 2.0], [6.5, 2.0], [6.5, 7.25], [2.0, 7.25]])
+    q = Quadrilateral(points)
+    assert (q.mapped_rectangle_points == np.array([[0, 0], [4.5, 0], [4.5, 5.25], [0, 5.25]])).all()
+    assert q.mapped_rectangle_points.dtype == np.float64
+
 def test_interval_relations():
     
     i = Interval(4, 5, axis='y')
@@ -175,6 +185,74 @@ def test_layout():
     l.shift(4)
     l.pad(left=2)
     
+def test_layout_batched_fast_paths():
+
+    # All-Rectangle layouts take the stacked-coordinate fast paths in
+    # shift/pad/scale; they must match the per-element results.
+    rects = Layout([Rectangle(1, 2, 3, 4), Rectangle(0, 0, 5, 5), Rectangle(2, 2, 8, 9)])
+    assert rects.shift([1, 2]) == Layout([ele.shift([1, 2]) for ele in rects])
+    assert rects.shift(3) == Layout([ele.shift(3) for ele in rects])
+    assert rects.scale([2, 3]) == Layout([ele.scale([2, 3]) for ele in rects])
+    assert rects.scale(2) == Layout([ele.scale(2) for ele in rects])
+    assert rects.pad(left=1, top=2, bottom=1) == Layout([ele.pad(left=1, top=2, bottom=1) for ele in rects])
+    assert rects.pad(left=5, safe_mode=False) == Layout([ele.pad(left=5, safe_mode=False) for ele in rects])
+    assert Layout.from_arrays([1, 0, 2], [2, 0, 2], [3, 5, 8], [4, 5, 9]) == rects
+    assert (rects.area == np.array([ele.area for ele in rects])).all()
+
+    # All-Quadrilateral layouts take the batched perspective transform
+    # in condition_on/relative_to.
+    quads = Layout([
+        Quadrilateral(np.array([[2, 2], [6, 2], [6, 7], [2, 6]])),
+        Quadrilateral(np.array([[1, 1], [4, 1], [5, 5], [1, 4]])),
+    ])
+    other = Quadrilateral(np.array([[0, 0], [10, 1], [11, 10], [1, 9]]))
+    assert quads.condition_on(other) == Layout([ele.condition_on(other) for ele in quads])
+    assert quads.relative_to(other) == Layout([ele.relative_to(other) for ele in quads])
+    assert quads.condition_on(other.to_rectangle()) == Layout([ele.condition_on(other.to_rectangle()) for ele in quads])
+    assert (quads.area == np.array([ele.area for ele in quads])).all()
+
+def test_layout_filter_by_and_contains_matrix():
+
+    quads = Layout([
+        Quadrilateral(np.array([[2, 2], [6, 2], [6, 7], [2, 6]])),
+        Quadrilateral(np.array([[1, 1], [4, 1], [5, 5], [1, 4]])),
+        Quadrilateral(np.array([[8, 8], [14, 8], [14, 14], [8, 14]])),
+    ])
+    container_q = Quadrilateral(np.array([[0, 0], [10, 1], [11, 10], [1, 9]]))
+    container_r = Rectangle(0, 0, 7, 8)
+
+    # The batched filter_by paths must agree with the per-element is_in
+    assert quads.filter_by(container_q) == Layout([ele for ele in quads if ele.is_in(container_q)])
+    assert quads.filter_by(container_r) == Layout([ele for ele in quads if ele.is_in(container_r)])
+    assert quads.filter_by(container_q, soft_margin={"bottom": 2}) == \
+        Layout([ele for ele in quads if ele.is_in(container_q, soft_margin={"bottom": 2})])
+
+    mask = quads.contains_matrix([container_q, container_r])
+    for i, ele in enumerate(quads):
+        assert mask[i, 0] == ele.is_in(container_q)
+        assert mask[i, 1] == ele.is_in(container_r)
+
+    # Intervals have a degenerate bounding box on the off axis, so both
+    # the row and the column fallbacks must agree with the scalar is_in
+    container_i = Interval(1, 8, axis='x')
+    mixed = Layout([Rectangle(2, 2, 5, 5), Interval(1, 8, axis='x'), quads[0]])
+    mask = mixed.contains_matrix([container_i, container_r, container_q, Rectangle(0, 5, 9, 9)])
+    for i, ele in enumerate(mixed):
+        for j, other in enumerate([container_i, container_r, container_q, Rectangle(0, 5, 9, 9)]):
+            assert mask[i, j] == ele.is_in(other)
+
+def test_layout_crop_image():
+
+    quads = Layout([
+        Quadrilateral(np.array([[2, 2], [6, 2], [6, 5], [2, 5]])),
+        Quadrilateral(np.array([[1, 1], [7, 2], [8, 8], [2, 7]])),
+    ])
+    img = np.random.randint(2, 24, (30, 20)).astype('uint8')
+
+    # The preallocated-buffer crops must match the per-element crops
+    for batched, single in zip(quads.crop_image(img), [ele.crop_image(img) for ele in quads]):
+        assert (batched == single).all()
+
 def test_df():
     
     df = pd.DataFrame(